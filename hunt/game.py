@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import numpy as np
+
 
 class Decision(object):
     """
@@ -10,6 +12,8 @@ class Decision(object):
         design (int): Selected design (zero-based index).
     """
 
+    __slots__ = ("strategy", "design")
+
     def __init__(self, strategy=0, design=0):
         self.strategy = strategy
         self.design = design
@@ -26,6 +30,8 @@ class Result(object):
         their_payoff (float): Resulting payoff for the other player.
     """
 
+    __slots__ = ("my_decision", "my_payoff", "their_decision", "their_payoff")
+
     def __init__(self, my_decision, my_payoff, their_decision, their_payoff):
         self.my_decision = my_decision
         self.my_payoff = my_payoff
@@ -55,6 +61,27 @@ class Player(object):
         """
         return Decision()
 
+    def reset(self, game):
+        """
+        Function called by the tournament to reuse this player for a new game.
+        Players with per-game state should override this function to
+        re-initialize that state.
+
+        Args:
+            game (:obj:`Game`): Game to be played by this player.
+        """
+        self.game = game
+
+    def prepare(self, num_reps):
+        """
+        Function called by the tournament before playing a known number of
+        replications of a game.
+
+        Args:
+            num_reps (int): Number of replications to be played.
+        """
+        pass
+
     def report_result(self, result):
         """
         Function called by the tournament to report the result of a game.
@@ -75,6 +102,7 @@ class InvalidDecisionError(Exception):
     """
 
     def __init__(self, player, decision):
+        super().__init__(player, decision)
         self.player = player
         self.decision = decision
 
@@ -90,10 +118,26 @@ class DesignGame(object):
             alternative lower-level designs. Each lower-level design is structured
             as a two-dimensional matrix of payoff values, indexed by player i,j
             strategy decisions.
+        designs_arr (:obj:`numpy.ndarray`): Read-only payoff values as a three-
+            dimensional array indexed by design, player i strategy, and player j
+            strategy. Aliases (rather than copies) designs supplied as an array.
     """
 
     def __init__(self, designs=[[[0, 0], [0, 0]]]):
         self.designs = designs
+        # read-only view so the payoffs can be safely shared between games
+        self.designs_arr = np.ascontiguousarray(designs, dtype=np.float64).view()
+        self.designs_arr.setflags(write=False)
+        self._num_designs = len(designs)
+        # utility tensors shared by all players, keyed by risk aversion
+        self._utility_tensors = {}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # unpickled arrays (e.g., in worker processes) are writeable by default
+        self.designs_arr.setflags(write=False)
+        for utility_tensor in self._utility_tensors.values():
+            utility_tensor.setflags(write=False)
 
     def get_payoff(self, my_decision, their_decision):
         """
@@ -106,9 +150,50 @@ class DesignGame(object):
         Returns:
             float: The focal player's resulting payoff.
         """
-        return self.designs[my_decision.design][my_decision.strategy][
-            their_decision.strategy
-        ]
+        return self.designs_arr.item(
+            my_decision.design, my_decision.strategy, their_decision.strategy
+        )
+
+    def get_utility_tensor(self, risk_aversion):
+        """
+        Gets the exponential utility of each payoff for a risk aversion
+        coefficient. Computed once for each coefficient and shared by all
+        players of this game.
+
+        Args:
+            risk_aversion (float): The risk aversion coefficient (risk neutral
+                if 0, risk seeking if negative).
+
+        Returns:
+            :obj:`numpy.ndarray`: Read-only utility values, indexed like
+                `designs_arr`.
+        """
+        if risk_aversion not in self._utility_tensors:
+            if risk_aversion == 0:
+                utility_tensor = self.designs_arr
+            else:
+                utility_tensor = (
+                    1 - np.exp(-risk_aversion * self.designs_arr)
+                ) / risk_aversion
+                utility_tensor.setflags(write=False)
+            self._utility_tensors[risk_aversion] = utility_tensor
+        return self._utility_tensors[risk_aversion]
+
+    def _is_valid(self, decision):
+        """
+        Checks whether a decision is valid for this game.
+
+        Args:
+            decision (:obj:`Decision`): The decision to check.
+
+        Returns:
+            bool: True, if the decision has a valid strategy and design.
+        """
+        return (
+            decision.strategy in (0, 1)
+            and isinstance(decision.design, (int, np.integer))
+            and 0 <= decision.design < self._num_designs
+        )
 
     def play(self, player_1, player_2):
         """
@@ -120,17 +205,14 @@ class DesignGame(object):
             player_2 (:obj:`Player`): The second player.
         """
         decision_1 = player_1.get_decision()
-        if decision_1.strategy not in [0, 1] or decision_1.design not in range(
-            len(self.designs)
-        ):
+        if not self._is_valid(decision_1):
             raise InvalidDecisionError(player_1, decision_1)
         decision_2 = player_2.get_decision()
-        if decision_2.strategy not in [0, 1] or decision_2.design not in range(
-            len(self.designs)
-        ):
+        if not self._is_valid(decision_2):
             raise InvalidDecisionError(player_2, decision_2)
         payoff_1 = self.get_payoff(decision_1, decision_2)
         payoff_2 = self.get_payoff(decision_2, decision_1)
-        player_1.report_result(Result(decision_1, payoff_1, decision_2, payoff_2))
+        result_1 = Result(decision_1, payoff_1, decision_2, payoff_2)
+        player_1.report_result(result_1)
         player_2.report_result(Result(decision_2, payoff_2, decision_1, payoff_1))
-        return Result(decision_1, payoff_1, decision_2, payoff_2)
+        return result_1
@@ -19,6 +19,37 @@ class RandomPlayer(Player):
         super().__init__(game, name)
         # initialize a random number stream
         self.rng = np.random.Generator(np.random.PCG64(seed))
+        self.reset(game)
+
+    def reset(self, game):
+        """
+        Reuse this player for a new game, discarding any prepared decisions.
+
+        Args:
+            game (:obj:`hunt.game.Game`): Game to be played by this player.
+        """
+        super().reset(game)
+        self._strategies = []
+        self._designs = []
+        self._idx = 0
+
+    def prepare(self, num_reps):
+        """
+        Draw random decisions for a known number of replications at once.
+
+        Args:
+            num_reps (int): Number of replications to be played.
+        """
+        num_designs = len(self.game.designs)
+        self._strategies = self.rng.integers(
+            0, 1, endpoint=True, size=num_reps
+        ).tolist()
+        self._designs = (
+            self.rng.integers(0, num_designs, size=num_reps).tolist()
+            if num_designs > 1
+            else [0] * num_reps
+        )
+        self._idx = 0
 
     def get_decision(self):
         """
@@ -27,6 +58,13 @@ class RandomPlayer(Player):
         Returns:
             :obj:`hunt.game.Decision`: The selected decision for the next game.
         """
+        if self._idx < len(self._strategies):
+            # use the next prepared decision
+            self._idx += 1
+            return Decision(
+                strategy=self._strategies[self._idx - 1],
+                design=self._designs[self._idx - 1],
+            )
         num_designs = len(self.game.designs)
         return Decision(
             strategy=self.rng.integers(0, 1, endpoint=True),
@@ -48,6 +86,16 @@ class MirrorPlayer(Player):
         super().__init__(game, name)
         # initialize a random number stream
         self.rng = np.random.Generator(np.random.PCG64(seed))
+        self.reset(game)
+
+    def reset(self, game):
+        """
+        Reuse this player for a new game with a new random initial decision.
+
+        Args:
+            game (:obj:`hunt.game.Game`): Game to be played by this player.
+        """
+        super().reset(game)
         # random initial decision
         num_designs = len(self.game.designs)
         self.next_decision = Decision(
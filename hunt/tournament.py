@@ -2,9 +2,373 @@
 
 import itertools
 import numpy as np
-import copy
+from concurrent.futures import ProcessPoolExecutor
 
-from .game import DesignGame, InvalidDecisionError
+from .game import DesignGame, InvalidDecisionError, Player
+from .player import MirrorPlayer, RandomPlayer
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+# column names and types of the replication log
+_REP_LOG_DTYPES = {
+    "game": np.int32,
+    "rep": np.int32,
+    "player_1": np.int32,
+    "player_1_design": np.int32,
+    "player_1_strategy": np.int8,
+    "player_1_payoff": np.float64,
+    "player_2": np.int32,
+    "player_2_design": np.int32,
+    "player_2_strategy": np.int8,
+    "player_2_payoff": np.float64,
+}
+
+
+# player columns of the replication log, filled in after each match
+_PLAYER_KEYS = ("player_1", "player_2")
+
+
+def _empty_rep_log(size, players=True):
+    """
+    Allocates an uninitialized replication log.
+
+    Args:
+        size (int): Number of replications to be logged.
+        players (bool): Whether to include the player columns.
+
+    Returns:
+        :obj:`dict` of :obj:`numpy.ndarray`: Array for each replication log column.
+    """
+    return {
+        key: np.empty(size, dtype)
+        for key, dtype in _REP_LOG_DTYPES.items()
+        if players or key not in _PLAYER_KEYS
+    }
+
+
+# player classes whose decisions can be scripted for compiled replications
+_STATELESS_PLAYERS = (Player, MirrorPlayer, RandomPlayer)
+
+
+def _script_decisions(player, num_reps):
+    """
+    Scripts the decisions of a stateless player for all replications of a game.
+
+    Args:
+        player (:obj:`hunt.game.Player`): Player of a class in `_STATELESS_PLAYERS`.
+        num_reps (int): Number of replications of the game.
+
+    Returns:
+        :obj:`tuple`: Whether the player mirrors the opponent's previous
+            decision, followed by arrays of strategy and design decisions for
+            each replication (only the initial decision for mirror players).
+    """
+    if type(player) is MirrorPlayer:
+        return (
+            True,
+            np.array([player.next_decision.strategy]),
+            np.array([player.next_decision.design]),
+        )
+    elif type(player) is RandomPlayer:
+        # draw the same decisions the player would use in interpreted replications
+        player.prepare(num_reps)
+        return (
+            False,
+            np.array(player._strategies, np.int64),
+            np.array(player._designs, np.int64),
+        )
+    else:
+        return (False, np.zeros(num_reps, np.int64), np.zeros(num_reps, np.int64))
+
+
+def _play_scripted_reps(
+    designs,
+    num_reps,
+    mirror_1,
+    strategies_1,
+    designs_1,
+    mirror_2,
+    strategies_2,
+    designs_2,
+    out_strategy_1,
+    out_design_1,
+    out_payoff_1,
+    out_strategy_2,
+    out_design_2,
+    out_payoff_2,
+):
+    """
+    Plays all replications of a game between two scripted players (see
+    `_script_decisions`) and writes their decisions and payoffs to the output
+    arrays. Compiled with numba, so only called if numba is installed.
+
+    Args:
+        designs (:obj:`numpy.ndarray`): Payoff values of the game, indexed by
+            design, player i strategy, and player j strategy.
+        num_reps (int): Number of replications of the game.
+        mirror_1 (bool): Whether the first player mirrors the opponent's
+            previous decision.
+        strategies_1 (:obj:`numpy.ndarray`): Strategy decisions of the first
+            player for each replication (only the initial one if mirroring).
+        designs_1 (:obj:`numpy.ndarray`): Design decisions of the first player
+            for each replication (only the initial one if mirroring).
+        mirror_2 (bool): Whether the second player mirrors the opponent's
+            previous decision.
+        strategies_2 (:obj:`numpy.ndarray`): Strategy decisions of the second
+            player for each replication (only the initial one if mirroring).
+        designs_2 (:obj:`numpy.ndarray`): Design decisions of the second player
+            for each replication (only the initial one if mirroring).
+        out_strategy_1 (:obj:`numpy.ndarray`): Output strategy of the first
+            player in each replication.
+        out_design_1 (:obj:`numpy.ndarray`): Output design of the first player
+            in each replication.
+        out_payoff_1 (:obj:`numpy.ndarray`): Output payoff of the first player
+            in each replication.
+        out_strategy_2 (:obj:`numpy.ndarray`): Output strategy of the second
+            player in each replication.
+        out_design_2 (:obj:`numpy.ndarray`): Output design of the second player
+            in each replication.
+        out_payoff_2 (:obj:`numpy.ndarray`): Output payoff of the second player
+            in each replication.
+    """
+    strategy_1 = strategies_1[0] if num_reps > 0 else 0
+    design_1 = designs_1[0] if num_reps > 0 else 0
+    strategy_2 = strategies_2[0] if num_reps > 0 else 0
+    design_2 = designs_2[0] if num_reps > 0 else 0
+    for rep in range(num_reps):
+        if rep > 0:
+            prior_strategy_1 = strategy_1
+            prior_design_1 = design_1
+            if mirror_1:
+                strategy_1 = strategy_2
+                design_1 = design_2
+            else:
+                strategy_1 = strategies_1[rep]
+                design_1 = designs_1[rep]
+            if mirror_2:
+                strategy_2 = prior_strategy_1
+                design_2 = prior_design_1
+            else:
+                strategy_2 = strategies_2[rep]
+                design_2 = designs_2[rep]
+        payoff_1 = designs[design_1, strategy_1, strategy_2]
+        payoff_2 = designs[design_2, strategy_2, strategy_1]
+        out_strategy_1[rep] = strategy_1
+        out_design_1[rep] = design_1
+        out_payoff_1[rep] = payoff_1
+        out_strategy_2[rep] = strategy_2
+        out_design_2[rep] = design_2
+        out_payoff_2[rep] = payoff_2
+
+
+if njit is not None:
+    _play_scripted_reps = njit(cache=True)(_play_scripted_reps)
+
+
+def _error_result(game, rep, player_1, player_2, error):
+    """
+    Describes an error raised while playing a replication of a game.
+
+    Args:
+        game (int): Index of the game.
+        rep (int): Index of the replication.
+        player_1 (:obj:`hunt.game.Player`): The first player.
+        player_2 (:obj:`hunt.game.Player`): The second player.
+        error (:obj:`Exception`): The error raised.
+
+    Returns:
+        :obj:`dict`: The error result.
+    """
+    if isinstance(error, InvalidDecisionError):
+        return {
+            "game": game,
+            "rep": rep,
+            "player": error.player.name,
+            "design": error.decision.design,
+            "strategy": error.decision.strategy,
+            "error": error,
+        }
+    else:
+        return {
+            "game": game,
+            "rep": rep,
+            "player_1": player_1.name,
+            "player_2": player_2.name,
+            "error": error,
+        }
+
+
+def _play_match(player_1_class, player_2_class, games, player_games, game_num_reps):
+    """
+    Plays all games of one match between two player classes. Defined at the
+    module level so matches can be dispatched to worker processes.
+
+    Args:
+        player_1_class (type): Class of the first player.
+        player_2_class (type): Class of the second player.
+        games (:obj:`list` of :obj:`hunt.game.Game`): List of games.
+        player_games (:obj:`list` of :obj:`hunt.game.DesignGame`): Read-only
+            copy of each game given to the players.
+        game_num_reps (:obj:`list` of int): Number of replications of each game.
+
+    Returns:
+        :obj:`tuple`: Replication log (excluding player columns), game results,
+            match result, and error results of this match.
+    """
+    n_games = len(games)
+    error_results = []
+    game_results = [None] * n_games
+    # allocate the replication log for all possible replications
+    rep_log = _empty_rep_log(sum(game_num_reps), players=False)
+    log_game = rep_log["game"]
+    log_rep = rep_log["rep"]
+    log_p1_design = rep_log["player_1_design"]
+    log_p1_strategy = rep_log["player_1_strategy"]
+    log_p1_payoff = rep_log["player_1_payoff"]
+    log_p2_design = rep_log["player_2_design"]
+    log_p2_strategy = rep_log["player_2_strategy"]
+    log_p2_payoff = rep_log["player_2_payoff"]
+    num_logged = 0
+    # initialize game scores
+    p1_game_scores = np.zeros(n_games)
+    p2_game_scores = np.zeros(n_games)
+    # player objects are created for the first game and reset for later games
+    player_1 = None
+    player_2 = None
+    # replications between stateless players can be compiled
+    scripted = (
+        njit is not None
+        and player_1_class in _STATELESS_PLAYERS
+        and player_2_class in _STATELESS_PLAYERS
+    )
+    # enumerate each game in the match
+    for g, game in enumerate(games):
+        # initialize player objects for this game
+        if player_1 is None:
+            player_1 = player_1_class(player_games[g])
+            player_2 = player_2_class(player_games[g])
+        else:
+            player_1.reset(player_games[g])
+            player_2.reset(player_games[g])
+        num_reps = game_num_reps[g]
+        game_start = num_logged
+        if scripted and type(game) is DesignGame:
+            # play all replicates in compiled code and record results
+            reps = slice(num_logged, num_logged + num_reps)
+            _play_scripted_reps(
+                game.designs_arr,
+                num_reps,
+                *_script_decisions(player_1, num_reps),
+                *_script_decisions(player_2, num_reps),
+                log_p1_strategy[reps],
+                log_p1_design[reps],
+                log_p1_payoff[reps],
+                log_p2_strategy[reps],
+                log_p2_design[reps],
+                log_p2_payoff[reps],
+            )
+            log_game[reps] = g
+            log_rep[reps] = np.arange(num_reps)
+            num_logged += num_reps
+        else:
+            player_1.prepare(num_reps)
+            player_2.prepare(num_reps)
+            # generate the number of game replicates
+            for rep in range(num_reps):
+                # play the game
+                try:
+                    results = game.play(player_1, player_2)
+                except Exception as e:
+                    error_results.append(_error_result(g, rep, player_1, player_2, e))
+                    if isinstance(e, InvalidDecisionError):
+                        # skip the remaining replicates after an invalid decision
+                        break
+                    continue
+                # log results of this replicate
+                log_game[num_logged] = g
+                log_rep[num_logged] = rep
+                log_p1_design[num_logged] = results.my_decision.design
+                log_p1_strategy[num_logged] = results.my_decision.strategy
+                log_p1_payoff[num_logged] = results.my_payoff
+                log_p2_design[num_logged] = results.their_decision.design
+                log_p2_strategy[num_logged] = results.their_decision.strategy
+                log_p2_payoff[num_logged] = results.their_payoff
+                num_logged += 1
+        # average the logged payoffs over all replications
+        p1_game_score = 0.0
+        p2_game_score = 0.0
+        if num_reps > 0:
+            game_reps = slice(game_start, num_logged)
+            p1_game_score = float(np.add.reduce(log_p1_payoff[game_reps])) / num_reps
+            p2_game_score = float(np.add.reduce(log_p2_payoff[game_reps])) / num_reps
+        # log results of this game
+        game_results[g] = {
+            "game": g,
+            "reps": num_reps,
+            "players": [
+                {"name": player_1.name, "score": p1_game_score},
+                {"name": player_2.name, "score": p2_game_score},
+            ],
+        }
+        # append results of this game to the match results
+        p1_game_scores[g] = p1_game_score
+        p2_game_scores[g] = p2_game_score
+    # average the game scores over all games
+    p1_match_score = float(np.add.reduce(p1_game_scores)) / n_games
+    p2_match_score = float(np.add.reduce(p2_game_scores)) / n_games
+    # log results of this match
+    match_result = {
+        "players": [
+            {"name": player_1.name, "score": p1_match_score},
+            {"name": player_2.name, "score": p2_match_score},
+        ]
+    }
+    # discard unused replication log entries
+    rep_log = {key: value[:num_logged] for key, value in rep_log.items()}
+    return rep_log, game_results, match_result, error_results
+
+
+# games of the tournament being run in a worker process
+_worker_games = None
+_worker_player_games = None
+
+
+def _init_worker(games):
+    """
+    Initializes a worker process with the games of a tournament, such that they
+    are sent to each worker once rather than with each match.
+
+    Args:
+        games (:obj:`list` of :obj:`hunt.game.Game`): List of games.
+    """
+    global _worker_games, _worker_player_games
+    _worker_games = games
+    _worker_player_games = [DesignGame(game.designs_arr) for game in games]
+
+
+def _play_worker_match(player_1_class, player_2_class, game_num_reps):
+    """
+    Plays all games of one match in a worker process (see `_init_worker`).
+
+    Args:
+        player_1_class (type): Class of the first player.
+        player_2_class (type): Class of the second player.
+        game_num_reps (:obj:`list` of int): Number of replications of each game.
+
+    Returns:
+        :obj:`tuple`: Outputs of `_play_match`.
+    """
+    return _play_match(
+        player_1_class,
+        player_2_class,
+        _worker_games,
+        _worker_player_games,
+        game_num_reps,
+    )
 
 
 class Tournament(object):
@@ -19,25 +383,99 @@ class Tournament(object):
         games (:obj:`list` of :obj:`hunt.game.Game`): List of games.
         num_reps (int): Number of replications for each game.
         p_rep (float): Probability of ending a game after each replication.
+        max_workers (int): Maximum number of worker processes used to play
+            matches. Runs all matches in the calling process if 1 (default);
+            uses one process per CPU if None. Worker processes require
+            picklable player classes, games, and player errors; the games
+            are sent once to each worker.
         rng (:obj:`numpy.random.Generator`): Random number generator.
         error_results (:obj:`list` of :obj:`dict`): List of any erroneous results.
-        rep_results (:obj:`list` of :obj:`dict`): List of results for each replication.
+            An invalid decision ends the game, so is recorded at most once per game.
+        rep_log (:obj:`dict` of :obj:`numpy.ndarray`): Columnar results for each
+            replication, identifying players by their index in `players`.
+        player_names (:obj:`list` of str): Name of each player.
+        rep_results (:obj:`list` of :obj:`dict`): List of results for each
+            replication (generated from `rep_log` when first accessed).
         game_results (:obj:`list` of :obj:`dict`): List of results for each game.
         match_results (:obj:`list` of :obj:`dict`): List of results for each match.
         results (:obj:`dict`): Overall results.
     """
 
-    def __init__(self, players=[], games=[], num_reps=None, p_rep=None, p_seed=None):
+    def __init__(
+        self,
+        players=[],
+        games=[],
+        num_reps=None,
+        p_rep=None,
+        p_seed=None,
+        max_workers=1,
+    ):
         self.players = players
         self.games = games
         self.num_reps = num_reps
         self.p_rep = p_rep
+        self.max_workers = max_workers
         self.rng = np.random.Generator(np.random.PCG64(p_seed))
         self.error_results = []
-        self.rep_results = []
+        self.rep_log = _empty_rep_log(0)
+        self.player_names = []
+        self._rep_results = None
         self.game_results = []
         self.match_results = []
-        self.results = {}
+        self._score_names = []
+        self._scores = np.zeros(0)
+
+    @property
+    def results(self):
+        """
+        Gets the overall results. The returned dictionary is a snapshot, so
+        changes to it are not stored; assign a whole dictionary instead.
+
+        Returns:
+            :obj:`dict`: Total score for each player name.
+        """
+        return dict(zip(self._score_names, self._scores.tolist()))
+
+    @results.setter
+    def results(self, results):
+        self._score_names = list(results.keys())
+        self._scores = np.array(list(results.values()), dtype=np.float64)
+
+    @property
+    def rep_results(self):
+        """
+        Gets the results for each replication as a list of nested dictionaries.
+
+        Returns:
+            :obj:`list` of :obj:`dict`: List of results for each replication.
+        """
+        if self._rep_results is None:
+            log = {key: value.tolist() for key, value in self.rep_log.items()}
+            self._rep_results = [
+                {
+                    "game": log["game"][i],
+                    "rep": log["rep"][i],
+                    "player_1": {
+                        "name": self.player_names[log["player_1"][i]],
+                        "design": log["player_1_design"][i],
+                        "strategy": log["player_1_strategy"][i],
+                        "payoff": log["player_1_payoff"][i],
+                    },
+                    "player_2": {
+                        "name": self.player_names[log["player_2"][i]],
+                        "design": log["player_2_design"][i],
+                        "strategy": log["player_2_strategy"][i],
+                        "payoff": log["player_2_payoff"][i],
+                    },
+                }
+                for i in range(len(log["game"]))
+            ]
+        return self._rep_results
+
+    @rep_results.setter
+    def rep_results(self, rep_results):
+        # replaces the results generated from rep_log until the next run
+        self._rep_results = rep_results
 
     def run(self):
         """
@@ -48,109 +486,87 @@ class Tournament(object):
         """
         # initialize results
         self.error_results = []
-        self.rep_results = []
-        self.game_results = []
-        self.match_results = []
-        self.results = {}
+        self._rep_results = None
+        games = list(self.games)
+        n_games = len(games)
+        n_players = len(self.players)
+        # players of each game share a copy that aliases its read-only payoffs
+        player_games = [DesignGame(game.designs_arr) for game in games]
         # generate list of matches (round-robin tournament)
-        matches = list(itertools.combinations_with_replacement(self.players, 2))
-        # run each match
-        for match in matches:
-            # initialize match scores
-            p1_match_score = 0
-            p2_match_score = 0
-            # enumerate each game in the match
-            for g, game in enumerate(self.games):
-                # initialize game scores
-                p1_game_score = 0
-                p2_game_score = 0
-                # initialize player objects for this game
-                player_1 = match[0](DesignGame(copy.deepcopy(game.designs)))
-                player_2 = match[1](DesignGame(copy.deepcopy(game.designs)))
-                if self.num_reps is None:
-                    num_reps = self.rng.geometric(self.p_rep)
-                else:
-                    num_reps = self.num_reps
-                # generate the number of game replicates
-                for rep in range(num_reps):
-                    # play the game and record results
-                    try:
-                        results = game.play(player_1, player_2)
-                        # log results of this replicate
-                        self.rep_results.append(
-                            {
-                                "game": g,
-                                "rep": rep,
-                                "player_1": {
-                                    "name": player_1.name,
-                                    "design": results.my_decision.design,
-                                    "strategy": results.my_decision.strategy,
-                                    "payoff": results.my_payoff,
-                                },
-                                "player_2": {
-                                    "name": player_2.name,
-                                    "design": results.their_decision.design,
-                                    "strategy": results.their_decision.strategy,
-                                    "payoff": results.their_payoff,
-                                },
-                            }
-                        )
-                        # append results of this replicate to the game results
-                        p1_game_score += results.my_payoff / num_reps
-                        p2_game_score += results.their_payoff / num_reps
-                    except InvalidDecisionError as e:
-                        self.error_results.append(
-                            {
-                                "game": g,
-                                "rep": rep,
-                                "player": e.player.name,
-                                "design": e.decision.design,
-                                "strategy": e.decision.strategy,
-                                "error": e,
-                            }
-                        )
-                    except Exception as e:
-                        self.error_results.append(
-                            {
-                                "game": g,
-                                "rep": rep,
-                                "player_1": player_1.name,
-                                "player_2": player_2.name,
-                                "error": e,
-                            }
-                        )
-                # log results of this game
-                self.game_results.append(
-                    {
-                        "game": g,
-                        "reps": num_reps,
-                        "players": [
-                            {"name": player_1.name, "score": p1_game_score},
-                            {"name": player_2.name, "score": p2_game_score},
-                        ],
-                    }
+        matches = list(itertools.combinations_with_replacement(range(n_players), 2))
+        # allocate game and match results to be filled in round-robin order
+        self.game_results = [None] * (len(matches) * n_games)
+        self.match_results = [None] * len(matches)
+        # sample the number of game replicates for each game in each match
+        if self.num_reps is None:
+            all_num_reps = self.rng.geometric(
+                self.p_rep, size=(len(matches), n_games)
+            ).tolist()
+        else:
+            all_num_reps = [[self.num_reps] * n_games] * len(matches)
+        # play all matches (matches share no state, so are submitted at once)
+        if self.max_workers == 1:
+            outputs = [
+                _play_match(
+                    self.players[i], self.players[j], games, player_games, num_reps
+                )
+                for (i, j), num_reps in zip(matches, all_num_reps)
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(games,),
+            ) as executor:
+                outputs = list(
+                    executor.map(
+                        _play_worker_match,
+                        [self.players[i] for i, j in matches],
+                        [self.players[j] for i, j in matches],
+                        all_num_reps,
+                    )
+                )
+        # name each player and assign an id to each unique name
+        self.player_names = [None] * n_players
+        for (i, j), (_, _, match_result, _) in zip(matches, outputs):
+            self.player_names[i] = match_result["players"][0]["name"]
+            self.player_names[j] = match_result["players"][1]["name"]
+        self._score_names = list(dict.fromkeys(self.player_names))
+        name_ids = {name: i for i, name in enumerate(self._score_names)}
+        score_ids = [name_ids[name] for name in self.player_names]
+        match_score_ids = []
+        match_scores = []
+        # merge results in round-robin order
+        self.rep_log = _empty_rep_log(
+            sum(len(rep_log["game"]) for rep_log, _, _, _ in outputs)
+        )
+        num_logged = 0
+        for m, (match, output) in enumerate(zip(matches, outputs)):
+            rep_log, game_results, match_result, error_results = output
+            rep_slice = slice(num_logged, num_logged + len(rep_log["game"]))
+            for key, value in rep_log.items():
+                self.rep_log[key][rep_slice] = value
+            self.rep_log["player_1"][rep_slice] = match[0]
+            self.rep_log["player_2"][rep_slice] = match[1]
+            num_logged = rep_slice.stop
+            self.game_results[m * n_games : (m + 1) * n_games] = game_results
+            self.match_results[m] = match_result
+            self.error_results.extend(error_results)
+            # weight the results of this match in the overall results
+            p1_id = score_ids[match[0]]
+            p2_id = score_ids[match[1]]
+            weight = (0.5 if p1_id == p2_id else 1) / n_players
+            match_score_ids.extend((p1_id, p2_id))
+            match_scores.extend(
+                (
+                    match_result["players"][0]["score"] * weight,
+                    match_result["players"][1]["score"] * weight,
                 )
-                # append results of this game to the match results
-                p1_match_score += p1_game_score / len(self.games)
-                p2_match_score += p2_game_score / len(self.games)
-            # log results of this match
-            self.match_results.append(
-                {
-                    "players": [
-                        {"name": player_1.name, "score": p1_match_score},
-                        {"name": player_2.name, "score": p2_match_score},
-                    ]
-                }
-            )
-            # append results of this match to the overall results
-            self.results[player_1.name] = self.results.get(
-                player_1.name, 0
-            ) + p1_match_score * (0.5 if player_1.name == player_2.name else 1) / len(
-                self.players
-            )
-            self.results[player_2.name] = self.results.get(
-                player_2.name, 0
-            ) + p2_match_score * (0.5 if player_1.name == player_2.name else 1) / len(
-                self.players
             )
+        # sum the weighted match scores for each player name
+        self._scores = np.bincount(
+            np.array(match_score_ids, dtype=np.intp),
+            weights=match_scores,
+            minlength=len(self._score_names),
+        )
         return self.results
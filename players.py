@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.stats as stats
 
 from hunt.game import Player, Decision
 
@@ -87,46 +86,33 @@ class RiskAwareRDplayer_neutral(RiskAwareRDplayer):
 class RiskAwareEUplayer(Player):
     def __init__(self, game, name, risk_aversion, prior_collab=1, prior_no_collab=1):
         super().__init__(game, name)
-        self.strategy_prior = np.array([prior_no_collab, prior_collab])
+        self.prior_collab = prior_collab
+        self.prior_no_collab = prior_no_collab
         self.risk_aversion = risk_aversion
+        self.reset(game)
 
-    def get_utility(self, value):
-        if self.risk_aversion == 0:
-            return value
-        else:
-            return (1 - np.exp(-self.risk_aversion * value)) / self.risk_aversion
+    def reset(self, game):
+        super().reset(game)
+        self.strategy_prior = np.array([self.prior_no_collab, self.prior_collab])
+        # utility of each payoff, indexed like game.designs_arr
+        self.U = game.get_utility_tensor(self.risk_aversion)
 
     def report_result(self, result):
         self.strategy_prior[result.their_decision.strategy] += 1
 
     def get_decision(self):
-        p_collab = stats.beta(self.strategy_prior[1], self.strategy_prior[0]).mean()
-
-        independent_expected_value = np.array(
-            [
-                self.get_utility(self.game.get_payoff(Decision(0, design), Decision(1)))
-                * p_collab
-                + self.get_utility(
-                    self.game.get_payoff(Decision(0, design), Decision(0))
-                )
-                * (1 - p_collab)
-                for design in range(len(self.game.designs))
-            ]
+        # mean of the beta(collab, no collab) distribution
+        p_collab = self.strategy_prior[1] / self.strategy_prior.sum()
+
+        independent_expected_value = self.U[:, 0, 1] * p_collab + self.U[:, 0, 0] * (
+            1 - p_collab
         )
-        independent_design = np.nanargmax(independent_expected_value)
+        independent_design = int(np.nanargmax(independent_expected_value))
 
-        collab_expected_value = np.array(
-            [
-                self.get_utility(self.game.get_payoff(Decision(1, design), Decision(1)))
-                * p_collab
-                + self.get_utility(
-                    self.game.get_payoff(Decision(1, design), Decision(0))
-                )
-                * (1 - p_collab)
-                for design in range(len(self.game.designs))
-            ]
+        collab_expected_value = self.U[:, 1, 1] * p_collab + self.U[:, 1, 0] * (
+            1 - p_collab
         )
-        collaborative_design = np.argmax(collab_expected_value)
+        collaborative_design = int(np.argmax(collab_expected_value))
 
         if np.all(
             collab_expected_value < independent_expected_value[independent_design]
@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.stats as stats
 
 from hunt.game import Player, Decision
 
@@ -8,123 +7,56 @@ class RiskAwareRDplayer(Player):
     def __init__(self, game, name, risk_aversion):
         super().__init__(game, name)
         self.risk_aversion = risk_aversion
-        self.their_prior_decision = None
+        self.reset(game)
 
-    def get_utility(self, value):
-        if self.risk_aversion == 0:
-            return value
-        else:
-            return (1 - np.exp(-self.risk_aversion * value)) / self.risk_aversion
+    def reset(self, game):
+        super().reset(game)
+        self.their_prior_decision = None
+        # utility of each payoff, indexed like game.designs_arr
+        self.U = game.get_utility_tensor(self.risk_aversion)
+        # log risk dominance ratio, indexed by collaborative design (assuming
+        # partner collaborates on the same design) and independent design;
+        # zero or negative ratios give -inf or nan (rather than raising errors),
+        # which the nan-aware reductions in get_decision skip
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.RD_table = np.log(
+                (self.U[None, :, 0, 0] - self.U[:, None, 1, 0])
+                / (self.U[:, None, 1, 1] - self.U[None, :, 0, 1])
+            )
+        # index of each design, for looking up risk dominance of all designs
+        self.design_ids = np.arange(len(self.U))
 
     def report_result(self, result):
         self.their_prior_decision = result.their_decision
 
     def get_risk_dominance(self, design, independent_design):
+        # design may be a single design or an array of designs
+        risk_dominance = self.RD_table[design, independent_design]
         if False:
             # old method assuming complete symmetry
-            return np.log(
-                (
-                    self.get_utility(
-                        self.game.get_payoff(
-                            Decision(0, independent_design), Decision(0)
-                        )
-                    )
-                    - self.get_utility(
-                        self.game.get_payoff(Decision(1, design), Decision(0))
-                    )
-                )
-                / (
-                    self.get_utility(
-                        self.game.get_payoff(Decision(1, design), Decision(1))
-                    )
-                    - self.get_utility(
-                        self.game.get_payoff(
-                            Decision(0, independent_design), Decision(1)
-                        )
-                    )
-                )
-            )
+            return risk_dominance
         else:
             # new method assuming partner's design is same as prior round
-            return 0.5 * np.log(
-                (
-                    self.get_utility(
-                        self.game.get_payoff(
-                            Decision(0, independent_design), Decision(0)
-                        )
-                    )
-                    - self.get_utility(
-                        self.game.get_payoff(Decision(1, design), Decision(0))
-                    )
-                )
-                / (
-                    self.get_utility(
-                        self.game.get_payoff(Decision(1, design), Decision(1))
-                    )
-                    - self.get_utility(
-                        self.game.get_payoff(
-                            Decision(0, independent_design), Decision(1)
-                        )
-                    )
-                )
-            ) + 0.5 * np.log(
-                (
-                    self.get_utility(
-                        self.game.get_payoff(
-                            Decision(0, independent_design), Decision(0)
-                        )
-                    )
-                    - self.get_utility(
-                        self.game.get_payoff(
-                            Decision(
-                                1,
-                                self.their_prior_decision.design
-                                if self.their_prior_decision is not None
-                                else design,
-                            ),
-                            Decision(0),
-                        )
-                    )
-                )
-                / (
-                    self.get_utility(
-                        self.game.get_payoff(
-                            Decision(
-                                1,
-                                self.their_prior_decision.design
-                                if self.their_prior_decision is not None
-                                else design,
-                            ),
-                            Decision(1),
-                        )
-                    )
-                    - self.get_utility(
-                        self.game.get_payoff(
-                            Decision(0, independent_design), Decision(1)
-                        )
-                    )
-                )
+            prior_design = (
+                self.their_prior_decision.design
+                if self.their_prior_decision is not None
+                else design
+            )
+            return (
+                0.5 * risk_dominance
+                + 0.5 * self.RD_table[prior_design, independent_design]
             )
 
     def get_decision(self):
         with np.errstate(invalid="ignore"):
-            independent_value = [
-                self.get_utility(self.game.get_payoff(Decision(0, design), Decision(0)))
-                for design in range(len(self.game.designs))
-            ]
+            independent_value = self.U[:, 0, 0]
             independent_design = np.nanargmax(independent_value)
 
-            risk_dominance = np.array(
-                [
-                    self.get_risk_dominance(design, independent_design)
-                    for design in range(len(self.game.designs))
-                ]
+            risk_dominance = self.get_risk_dominance(
+                self.design_ids, independent_design
             )
 
-            collaborative_value = [
-                self.get_utility(self.game.get_payoff(Decision(1, design), Decision(1)))
-                for design in range(len(self.game.designs))
-            ]
+            collaborative_value = self.U[:, 1, 1]
             collaborative_design = np.argmax(collaborative_value * (risk_dominance < 0))
             if np.nanmin(risk_dominance) < 0:
                 return Decision(1, collaborative_design)
@@ -160,46 +92,33 @@ class RiskAwareRDplayer_neutral(RiskAwareRDplayer):
 class RiskAwareEUplayer(Player):
     def __init__(self, game, name, risk_aversion, prior_collab=1, prior_no_collab=1):
         super().__init__(game, name)
-        self.strategy_prior = np.array([prior_no_collab, prior_collab])
+        self.prior_collab = prior_collab
+        self.prior_no_collab = prior_no_collab
         self.risk_aversion = risk_aversion
+        self.reset(game)
 
-    def get_utility(self, value):
-        if self.risk_aversion == 0:
-            return value
-        else:
-            return (1 - np.exp(-self.risk_aversion * value)) / self.risk_aversion
+    def reset(self, game):
+        super().reset(game)
+        self.strategy_prior = np.array([self.prior_no_collab, self.prior_collab])
+        # utility of each payoff, indexed like game.designs_arr
+        self.U = game.get_utility_tensor(self.risk_aversion)
 
     def report_result(self, result):
         self.strategy_prior[result.their_decision.strategy] += 1
 
     def get_decision(self):
-        p_collab = stats.beta(self.strategy_prior[1], self.strategy_prior[0]).mean()
-
-        independent_expected_value = np.array(
-            [
-                self.get_utility(self.game.get_payoff(Decision(0, design), Decision(1)))
-                * p_collab
-                + self.get_utility(
-                    self.game.get_payoff(Decision(0, design), Decision(0))
-                )
-                * (1 - p_collab)
-                for design in range(len(self.game.designs))
-            ]
+        # mean of the beta(collab, no collab) distribution
+        p_collab = self.strategy_prior[1] / self.strategy_prior.sum()
+
+        independent_expected_value = self.U[:, 0, 1] * p_collab + self.U[:, 0, 0] * (
+            1 - p_collab
         )
-        independent_design = np.nanargmax(independent_expected_value)
-
-        collab_expected_value = np.array(
-            [
-                self.get_utility(self.game.get_payoff(Decision(1, design), Decision(1)))
-                * p_collab
-                + self.get_utility(
-                    self.game.get_payoff(Decision(1, design), Decision(0))
-                )
-                * (1 - p_collab)
-                for design in range(len(self.game.designs))
-            ]
+        independent_design = int(np.nanargmax(independent_expected_value))
+
+        collab_expected_value = self.U[:, 1, 1] * p_collab + self.U[:, 1, 0] * (
+            1 - p_collab
         )
-        collaborative_design = np.argmax(collab_expected_value)
+        collaborative_design = int(np.argmax(collab_expected_value))
 
         if np.all(
             collab_expected_value < independent_expected_value[independent_design]